@@ -1,6 +1,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -48,6 +49,11 @@ class MailboxHandlers(MailboxBase, BaseHandler):
         """
         request = await stream.recv_message()
         assert request is not None
+        resp = await self._append(request, stream.metadata)
+        await stream.send_message(resp)
+
+    async def _append(self, request: AppendRequest,
+                      metadata: Mapping[str, str]) -> AppendResponse:
         mailbox = request.mailbox or 'INBOX'
         flag_set = frozenset(Flag(flag) for flag in request.flags)
         when = datetime.fromtimestamp(request.when, timezone.utc)
@@ -56,7 +62,7 @@ class MailboxHandlers(MailboxBase, BaseHandler):
         validity: Optional[int] = None
         uid: Optional[int] = None
         async with self.catch_errors('Append') as result, \
-                self.login_as(stream.metadata, request.user) as identity, \
+                self.login_as(metadata, request.user) as identity, \
                 self.with_session(identity) as session:
             if session.filter_set is not None:
                 filter_value = await session.filter_set.get_active()
@@ -67,14 +73,12 @@ class MailboxHandlers(MailboxBase, BaseHandler):
                         request.sender, request.recipient,
                         mailbox, append_msg)
                     if new_mailbox is None:
-                        await stream.send_message(AppendResponse())
-                        return
+                        return AppendResponse()
                     else:
                         mailbox = new_mailbox
             append_uid, _ = await session.append_messages(
                 mailbox, [append_msg])
             validity = append_uid.validity
             uid = next(iter(append_uid.uids))
-        resp = AppendResponse(result=result, mailbox=mailbox,
+        return AppendResponse(result=result, mailbox=mailbox,
                               validity=validity, uid=uid)
-        await stream.send_message(resp)
@@ -8,6 +8,7 @@ from argparse import ArgumentParser, Namespace
 from collections.abc import Awaitable, Mapping, Sequence, AsyncIterator
 from contextlib import closing, asynccontextmanager
 from datetime import datetime, timezone
+from functools import lru_cache
 from secrets import token_bytes
 from typing import Any, Optional, Final
 
@@ -33,6 +34,17 @@ from ..session import BaseSession
 __all__ = ['DictBackend', 'Config']
 
 
+@lru_cache(maxsize=None)
+def _list_resource(resource: str, path: str) -> tuple[str, ...]:
+    return tuple(sorted(resource_listdir(resource, path)))
+
+
+@lru_cache(maxsize=None)
+def _read_resource(resource: str, path: str) -> bytes:
+    with closing(resource_stream(resource, path)) as stream:
+        return stream.read()
+
+
 class DictBackend(BackendInterface):
     """Defines a backend that uses an in-memory dictionary for example usage
     and integration testing.
@@ -234,7 +246,7 @@ class Identity(IdentityInterface):
                          filter_set: FilterSet) -> None:
         inbox = await mailbox_set.get_mailbox('INBOX')
         await self._load_demo_mailbox(resource, 'INBOX', inbox)
-        mbx_names = sorted(resource_listdir(resource, 'demo'))
+        mbx_names = _list_resource(resource, 'demo')
         for name in mbx_names:
             if name == 'sieve':
                 await self._load_demo_sieve(resource, name, filter_set)
@@ -246,15 +258,14 @@ class Identity(IdentityInterface):
     async def _load_demo_sieve(self, resource: str, name: str,
                                filter_set: FilterSet) -> None:
         path = os.path.join('demo', name)
-        with closing(resource_stream(resource, path)) as sieve_stream:
-            sieve = sieve_stream.read()
+        sieve = _read_resource(resource, path)
         await filter_set.put('demo', sieve)
         await filter_set.set_active('demo')
 
     async def _load_demo_mailbox(self, resource: str, name: str,
                                  mbx: MailboxData) -> None:
         path = os.path.join('demo', name)
-        msg_names = sorted(resource_listdir(resource, path))
+        msg_names = _list_resource(resource, path)
         for msg_name in msg_names:
             if msg_name == '.readonly':
                 mbx._readonly = True
@@ -262,10 +273,9 @@ class Identity(IdentityInterface):
             elif msg_name.startswith('.'):
                 continue
             msg_path = os.path.join(path, msg_name)
-            with closing(resource_stream(resource, msg_path)) as msg_stream:
-                flags_line = msg_stream.readline()
-                msg_timestamp = float(msg_stream.readline())
-                msg_data = msg_stream.read()
+            flags_line, timestamp_line, msg_data = _read_resource(
+                resource, msg_path).split(b'\n', 2)
+            msg_timestamp = float(timestamp_line)
             msg_dt = datetime.fromtimestamp(msg_timestamp, timezone.utc)
             msg_flags = {Flag(flag) for flag in flags_line.split()}
             if Recent in msg_flags:
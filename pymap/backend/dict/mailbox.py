@@ -200,6 +200,8 @@ class MailboxData(MailboxDataInterface[Message]):
         self._max_uid = 100
         self._mod_sequences = _ModSequenceMapping()
         self._messages: dict[int, Message] = {}
+        self._num_recent = 0
+        self._num_unseen = 0
 
     @property
     def mailbox_id(self) -> ObjectId:
@@ -221,6 +223,12 @@ class MailboxData(MailboxDataInterface[Message]):
     def selected_set(self) -> SelectedSet:
         return self._selected_set
 
+    def _count(self, message: Message, delta: int) -> None:
+        if message.recent:
+            self._num_recent += delta
+        if Seen not in message.permanent_flags:
+            self._num_unseen += delta
+
     async def update_selected(self, selected: SelectedMailbox, *,
                               wait_on: Event = None) -> SelectedMailbox:
         if wait_on is not None:
@@ -240,34 +248,62 @@ class MailboxData(MailboxDataInterface[Message]):
 
     async def append(self, append_msg: AppendMessage, *,
                      recent: bool = False) -> Message:
-        when = append_msg.when or datetime.now()
-        content = MessageContent.parse(append_msg.literal)
-        email_id = self._content_cache.add(content)
-        thread_id = self._thread_cache.add(content)
+        messages = await self.append_all([append_msg], recent=recent)
+        return messages[0]
+
+    async def append_all(self, append_msgs: Sequence[AppendMessage], *,
+                         recent: bool = False) -> Sequence[Message]:
+        parsed: list[tuple[AppendMessage, MessageContent,
+                           ObjectId, ObjectId]] = []
+        for append_msg in append_msgs:
+            content = MessageContent.parse(append_msg.literal)
+            email_id = self._content_cache.add(content)
+            thread_id = self._thread_cache.add(content)
+            parsed.append((append_msg, content, email_id, thread_id))
+        if not parsed:
+            return []
         async with self.messages_lock.write_lock():
-            self._max_uid = new_uid = self._max_uid + 1
-            message = Message(new_uid, when, append_msg.flag_set,
-                              email_id=email_id, thread_id=thread_id,
-                              recent=recent, content=content)
-            self._messages[new_uid] = message
-            self._mod_sequences.update([new_uid])
+            first_uid = self._max_uid + 1
+            self._max_uid += len(parsed)
+            messages: list[Message] = []
+            for new_uid, (append_msg, content, email_id, thread_id) in \
+                    enumerate(parsed, first_uid):
+                when = append_msg.when or datetime.now()
+                message = Message(new_uid, when, append_msg.flag_set,
+                                  email_id=email_id, thread_id=thread_id,
+                                  recent=recent, content=content)
+                self._messages[new_uid] = message
+                self._count(message, 1)
+                messages.append(message)
+            self._mod_sequences.update(range(first_uid, self._max_uid + 1))
             self._updated.set()
-            return message
+            return messages
 
     async def copy(self, uid: int, destination: MailboxData, *,
                    recent: bool = False) -> Optional[int]:
+        copied = await self.copy_all([uid], destination, recent=recent)
+        return copied[0][1] if copied else None
+
+    async def copy_all(self, uids: Iterable[int], destination: MailboxData, *,
+                       recent: bool = False) -> Sequence[tuple[int, int]]:
         async with self.messages_lock.read_lock():
-            try:
-                message = self._messages[uid]
-            except KeyError:
-                return None
+            messages = [self._messages[uid] for uid in uids
+                        if uid in self._messages]
+        if not messages:
+            return []
         async with destination.messages_lock.write_lock():
-            destination._max_uid = dest_uid = destination._max_uid + 1
-            new_msg = Message.copy(message, uid=dest_uid, recent=recent)
-            destination._messages[dest_uid] = new_msg
-            destination._mod_sequences.update([dest_uid])
+            first_uid = destination._max_uid + 1
+            destination._max_uid += len(messages)
+            ret: list[tuple[int, int]] = []
+            for dest_uid, message in enumerate(messages, first_uid):
+                new_msg = Message.copy(message, uid=dest_uid, recent=recent)
+                destination._messages[dest_uid] = new_msg
+                destination._count(new_msg, 1)
+                ret.append((message.uid, dest_uid))
+            destination._mod_sequences.update(
+                range(first_uid, destination._max_uid + 1))
             destination._updated.set()
-        return dest_uid
+        return ret
 
     async def move(self, uid: int, destination: MailboxData, *,
                    recent: bool = False) -> Optional[int]:
@@ -276,12 +312,14 @@ class MailboxData(MailboxDataInterface[Message]):
                 message = self._messages.pop(uid)
             except KeyError:
                 return None
+            self._count(message, -1)
             self._mod_sequences.expunge([uid])
             self._updated.set()
         async with destination.messages_lock.write_lock():
             destination._max_uid = dest_uid = destination._max_uid + 1
             new_msg = Message.copy(message, uid=dest_uid, recent=recent)
             destination._messages[dest_uid] = new_msg
+            destination._count(new_msg, 1)
             destination._mod_sequences.update([dest_uid])
             destination._updated.set()
         return dest_uid
@@ -297,32 +335,67 @@ class MailboxData(MailboxDataInterface[Message]):
             msg = Message.copy(cached_msg, expunged=True)
         return msg
 
+    def _update_flags(self, msg: Message, flag_set: frozenset[Flag],
+                      mode: FlagOp) -> bool:
+        new_flags = mode.apply(msg.permanent_flags, flag_set)
+        if new_flags == msg.permanent_flags:
+            return False
+        if self._messages.get(msg.uid) is msg:
+            self._count(msg, -1)
+            msg.permanent_flags = new_flags
+            self._count(msg, 1)
+        else:
+            msg.permanent_flags = new_flags
+        return True
+
     async def update(self, uid: int, cached_msg: CachedMessage,
                      flag_set: frozenset[Flag], mode: FlagOp) -> Message:
         msg = await self.get(uid, cached_msg)
-        msg.permanent_flags = mode.apply(msg.permanent_flags, flag_set)
-        self._mod_sequences.update([uid])
-        self._updated.set()
+        async with self.messages_lock.write_lock():
+            if self._update_flags(msg, flag_set, mode):
+                self._mod_sequences.update([uid])
+                self._updated.set()
         return msg
 
+    async def update_all(self, cached_msgs: Sequence[CachedMessage],
+                         flag_set: frozenset[Flag], mode: FlagOp) \
+            -> Sequence[Message]:
+        ret = [await self.get(cached_msg.uid, cached_msg)
+               for cached_msg in cached_msgs]
+        async with self.messages_lock.write_lock():
+            updated = [msg.uid for msg in ret
+                       if self._update_flags(msg, flag_set, mode)]
+            if updated:
+                self._mod_sequences.update(updated)
+                self._updated.set()
+        return ret
+
     async def delete(self, uids: Iterable[int]) -> None:
         async with self.messages_lock.write_lock():
             for uid in uids:
                 try:
-                    del self._messages[uid]
+                    message = self._messages.pop(uid)
                 except KeyError:
                     pass
+                else:
+                    self._count(message, -1)
             self._mod_sequences.expunge(uids)
             self._updated.set()
 
     async def claim_recent(self, selected: SelectedMailbox) -> None:
+        if not self._num_recent:
+            return
         uids: list[int] = []
-        async for msg in self.messages():
-            if msg.recent:
-                msg.recent = False
-                msg_uid = msg.uid
-                selected.session_flags.add_recent(msg_uid)
-                uids.append(msg_uid)
+        async with self.messages_lock.write_lock():
+            for msg in self._messages.values():
+                if msg.recent:
+                    msg.recent = False
+                    msg_uid = msg.uid
+                    selected.session_flags.add_recent(msg_uid)
+                    uids.append(msg_uid)
+                    self._num_recent -= 1
+                    if not self._num_recent:
+                        break
         self._mod_sequences.update(uids)
         self._updated.set()
 
@@ -335,19 +408,17 @@ class MailboxData(MailboxDataInterface[Message]):
                 yield msg
 
     async def snapshot(self) -> MailboxSnapshot:
-        exists = 0
-        recent = 0
-        unseen = 0
         first_unseen: Optional[int] = None
-        next_uid = self._max_uid + 1
-        async for msg in self.messages():
-            exists += 1
-            if msg.recent:
-                recent += 1
-            if Seen not in msg.permanent_flags:
-                unseen += 1
-                if first_unseen is None:
-                    first_unseen = exists
+        async with self.messages_lock.read_lock():
+            exists = len(self._messages)
+            recent = self._num_recent
+            unseen = self._num_unseen
+            next_uid = self._max_uid + 1
+            if unseen:
+                for seq, msg in enumerate(self._messages.values(), 1):
+                    if Seen not in msg.permanent_flags:
+                        first_unseen = seq
+                        break
         return MailboxSnapshot(self.mailbox_id, self.readonly,
                                self.uid_validity, self.permanent_flags,
                                self.session_flags, exists, recent, unseen,
@@ -368,63 +439,87 @@ class MailboxSet(MailboxSetInterface[MailboxData]):
         self._set: dict[str, MailboxData] = {}
         self._set_lock = subsystem.get().new_rwlock()
         self._subscribed: dict[str, bool] = {}
+        self._list_tree: Optional[tuple[
+            dict[str, MailboxData], ListTree]] = None
+        self._subscribed_tree: Optional[tuple[
+            dict[str, MailboxData], dict[str, bool], ListTree]] = None
 
     @property
     def delimiter(self) -> str:
         return '/'
 
+    def _get_list_tree(self) -> ListTree:
+        snapshot = self._set
+        cached = self._list_tree
+        if cached is not None and cached[0] is snapshot:
+            return cached[1]
+        list_tree = ListTree(self.delimiter).update(
+            'INBOX', *snapshot.keys())
+        self._list_tree = (snapshot, list_tree)
+        return list_tree
+
     async def set_subscribed(self, name: str, subscribed: bool) -> None:
         async with self._set_lock.write_lock():
-            self._subscribed[name] = subscribed
+            self._subscribed = {**self._subscribed, name: subscribed}
 
     async def list_subscribed(self) -> ListTree:
-        async with self._set_lock.read_lock():
-            mailboxes = [child for child in self._set.keys()
-                         if self._subscribed.get(child)]
-        return ListTree(self.delimiter).update('INBOX', *mailboxes)
+        snapshot = self._set
+        subscribed = self._subscribed
+        cached = self._subscribed_tree
+        if cached is not None and cached[0] is snapshot \
+                and cached[1] is subscribed:
+            return cached[2]
+        mailboxes = [child for child in snapshot.keys()
+                     if subscribed.get(child)]
+        subscribed_tree = ListTree(self.delimiter).update(
+            'INBOX', *mailboxes)
+        self._subscribed_tree = (snapshot, subscribed, subscribed_tree)
+        return subscribed_tree
 
     async def list_mailboxes(self) -> ListTree:
-        async with self._set_lock.read_lock():
-            mailboxes = list(self._set.keys())
-        return ListTree(self.delimiter).update('INBOX', *mailboxes)
+        return self._get_list_tree()
 
     async def get_mailbox(self, name: str) -> MailboxData:
         if name.upper() == 'INBOX':
             return self._inbox
-        async with self._set_lock.read_lock():
-            return self._set[name]
+        return self._set[name]
 
     async def add_mailbox(self, name: str) -> ObjectId:
-        async with self._set_lock.read_lock():
-            if name in self._set:
-                raise ValueError(name)
+        if name in self._set:
+            raise ValueError(name)
         async with self._set_lock.write_lock():
-            self._set[name] = mbx = MailboxData(
-                self._content_cache, self._thread_cache)
+            snapshot = self._set
+            if name in snapshot:
+                raise ValueError(name)
+            mbx = MailboxData(self._content_cache, self._thread_cache)
+            self._set = {**snapshot, name: mbx}
             return mbx.mailbox_id
 
     async def delete_mailbox(self, name: str) -> None:
-        async with self._set_lock.read_lock():
-            if name not in self._set:
-                raise KeyError(name)
+        if name not in self._set:
+            raise KeyError(name)
         async with self._set_lock.write_lock():
-            del self._set[name]
+            new_set = dict(self._set)
+            del new_set[name]
+            self._set = new_set
 
     async def rename_mailbox(self, before: str, after: str) -> None:
-        async with self._set_lock.read_lock():
-            tree = ListTree(self.delimiter).update('INBOX', *self._set.keys())
+        async with self._set_lock.write_lock():
+            tree = self._get_list_tree()
             before_entry = tree.get(before)
             after_entry = tree.get(after)
             if before_entry is None:
                 raise KeyError(before)
             elif after_entry is not None:
                 raise ValueError(after)
-        async with self._set_lock.write_lock():
+            new_set = dict(self._set)
+            new_inbox = self._inbox
             for before_name, after_name in tree.get_renames(before, after):
                 if before_name == 'INBOX':
-                    self._set[after_name] = self._inbox
-                    self._inbox = MailboxData(
+                    new_set[after_name] = new_inbox
+                    new_inbox = MailboxData(
                         self._content_cache, self._thread_cache)
                 else:
-                    self._set[after_name] = self._set[before_name]
-                    del self._set[before_name]
+                    new_set[after_name] = new_set.pop(before_name)
+            self._set = new_set
+            self._inbox = new_inbox
@@ -96,6 +96,20 @@ class MailboxDataInterface(Protocol[MessageT_co]):
         """
         ...
 
+    async def append_all(self, append_msgs: Sequence[AppendMessage], *,
+                         recent: bool = False) -> Sequence[MessageT_co]:
+        """Adds new messages to the end of the mailbox, returning copies of
+        the messages with their assigned UIDs. Backends may override this to
+        assign the UIDs of all the messages at once.
+
+        Args:
+            append_msgs: The new message data.
+            recent: True if the messages should be marked recent.
+
+        """
+        return [await self.append(append_msg, recent=recent)
+                for append_msg in append_msgs]
+
     @abstractmethod
     async def copy(self: MailboxDataT, uid: int, destination: MailboxDataT, *,
                    recent: bool = False) -> Optional[int]:
@@ -110,6 +124,27 @@ class MailboxDataInterface(Protocol[MessageT_co]):
         """
         ...
 
+    async def copy_all(self: MailboxDataT, uids: Iterable[int],
+                       destination: MailboxDataT, *,
+                       recent: bool = False) -> Sequence[tuple[int, int]]:
+        """Copies the messages that exist from this mailbox to the
+        *destination* mailbox, returning the source and destination UID pairs.
+        Backends may override this to assign the UIDs of all the messages at
+        once.
+
+        Args:
+            uids: The UIDs of the messages to copy.
+            destination: The destination mailbox.
+            recent: True if the messages should be marked recent.
+
+        """
+        ret: list[tuple[int, int]] = []
+        for uid in uids:
+            dest_uid = await self.copy(uid, destination, recent=recent)
+            if dest_uid is not None:
+                ret.append((uid, dest_uid))
+        return ret
+
     @abstractmethod
     async def move(self: MailboxDataT, uid: int, destination: MailboxDataT, *,
                    recent: bool = False) -> Optional[int]:
@@ -149,6 +184,21 @@ class MailboxDataInterface(Protocol[MessageT_co]):
         """
         ...
 
+    async def update_all(self, cached_msgs: Sequence[CachedMessage],
+                         flag_set: frozenset[Flag], mode: FlagOp) \
+            -> Sequence[MessageT_co]:
+        """Update the permanent flags of several messages. Backends may
+        override this to notify other sessions only once for the whole batch.
+
+        Args:
+            cached_msgs: The last known cached messages.
+            flag_set: The set of flags for the update operation.
+            flag_op: The mode to change the flags.
+
+        """
+        return [await self.update(cached_msg.uid, cached_msg, flag_set, mode)
+                for cached_msg in cached_msgs]
+
     @abstractmethod
     async def delete(self, uids: Iterable[int]) -> None:
         """Delete messages with the given UIDs.
@@ -213,7 +263,7 @@ class MailboxDataInterface(Protocol[MessageT_co]):
         """
         session_flags = selected.session_flags
         return [msg.uid async for _, msg in self.find(seq_set, selected)
-                if Deleted in msg.get_flags(session_flags)]
+                if msg.has_flag(Deleted, session_flags)]
 
 
 class MailboxSetInterface(Protocol[MailboxDataT_co]):
@@ -171,12 +171,13 @@ class BaseSession(SessionInterface, Generic[MessageT]):
         if mbx.readonly:
             raise MailboxReadOnly(name)
         dest_selected = self._pick_selected(selected, mbx)
-        uids: list[int] = []
-        for append_msg in messages:
-            msg = await mbx.append(append_msg, recent=not dest_selected)
-            if dest_selected:
-                dest_selected.session_flags.add_recent(msg.uid)
-            uids.append(msg.uid)
+        recent = not dest_selected
+        dest_flags = dest_selected.session_flags if dest_selected else None
+        appended = await mbx.append_all(messages, recent=recent)
+        uids = [msg.uid for msg in appended]
+        if dest_flags is not None:
+            for uid in uids:
+                dest_flags.add_recent(uid)
         return (AppendUid(mbx.uid_validity, uids),
                 await self._load_updates(selected, mbx))
 
@@ -206,29 +207,42 @@ class BaseSession(SessionInterface, Generic[MessageT]):
             -> tuple[Iterable[tuple[int, MessageT]], SelectedMailbox]:
         mbx = await self._get_selected(selected)
         ret: list[tuple[int, MessageT]] = []
-        for seq, cached_msg in selected.messages.get_all(sequence_set):
-            if set_seen:
-                msg = await mbx.update(cached_msg.uid, cached_msg,
-                                       frozenset({Seen}), FlagOp.ADD)
-            else:
+        if set_seen:
+            found = list(selected.messages.get_all(sequence_set))
+            msgs = await mbx.update_all(
+                [cached_msg for _, cached_msg in found],
+                frozenset({Seen}), FlagOp.ADD)
+            ret.extend((seq, msg) for (seq, _), msg in zip(found, msgs))
+        else:
+            for seq, cached_msg in selected.messages.get_all(sequence_set):
                 msg = await mbx.get(cached_msg.uid, cached_msg)
-            if msg is not None:
-                ret.append((seq, msg))
+                if msg is not None:
+                    ret.append((seq, msg))
         return ret, await mbx.update_selected(selected)
 
     async def search_mailbox(self, selected: SelectedMailbox,
                              keys: frozenset[SearchKey]) \
             -> tuple[Iterable[tuple[int, MessageT]], SelectedMailbox]:
         mbx = await self._get_selected(selected)
-        req = FetchRequirement.reduce(key.requirement for key in keys)
+        content_keys = frozenset(
+            key for key in keys
+            if not key.requirement.has_none(FetchRequirement.CONTENT))
+        content_req = FetchRequirement.reduce(
+            key.requirement for key in content_keys)
         ret: list[tuple[int, MessageT]] = []
         params = SearchParams(selected,
                               disabled=self.config.disable_search_keys)
-        search = SearchCriteriaSet(keys, params)
+        search = SearchCriteriaSet(keys - content_keys, params)
+        content_search = SearchCriteriaSet(content_keys, params)
         async for seq, msg in mbx.find(search.sequence_set, selected):
-            msg_content = await msg.load_content(req)
-            if search.matches(seq, msg, msg_content):
-                ret.append((seq, msg))
+            msg_metadata = await msg.load_content(FetchRequirement.METADATA)
+            if not search.matches(seq, msg, msg_metadata):
+                continue
+            elif content_keys:
+                msg_content = await msg.load_content(content_req)
+                if not content_search.matches(seq, msg, msg_content):
+                    continue
+            ret.append((seq, msg))
         return ret, await mbx.update_selected(selected)
 
     async def expunge_mailbox(self, selected: SelectedMailbox,
@@ -251,14 +265,14 @@ class BaseSession(SessionInterface, Generic[MessageT]):
         if dest.readonly:
             raise MailboxReadOnly(mailbox)
         dest_selected = self._pick_selected(selected, dest)
-        uids: list[tuple[int, int]] = []
-        for _, source_uid in selected.messages.get_uids(sequence_set):
-            dest_uid = await mbx.copy(source_uid, dest,
-                                      recent=not dest_selected)
-            if dest_uid is not None:
-                if dest_selected:
-                    dest_selected.session_flags.add_recent(dest_uid)
-                uids.append((source_uid, dest_uid))
+        recent = not dest_selected
+        dest_flags = dest_selected.session_flags if dest_selected else None
+        source_uids = [uid for _, uid in
+                       selected.messages.get_uids(sequence_set)]
+        uids = await mbx.copy_all(source_uids, dest, recent=recent)
+        if dest_flags is not None:
+            for _, dest_uid in uids:
+                dest_flags.add_recent(dest_uid)
         if not uids:
             copy_uid: Optional[CopyUid] = None
         else:
@@ -274,13 +288,14 @@ class BaseSession(SessionInterface, Generic[MessageT]):
         if dest.readonly:
             raise MailboxReadOnly(mailbox)
         dest_selected = self._pick_selected(selected, dest)
+        recent = not dest_selected
+        dest_flags = dest_selected.session_flags if dest_selected else None
         uids: list[tuple[int, int]] = []
         for _, source_uid in selected.messages.get_uids(sequence_set):
-            dest_uid = await mbx.move(source_uid, dest,
-                                      recent=not dest_selected)
+            dest_uid = await mbx.move(source_uid, dest, recent=recent)
             if dest_uid is not None:
-                if dest_selected:
-                    dest_selected.session_flags.add_recent(dest_uid)
+                if dest_flags is not None:
+                    dest_flags.add_recent(dest_uid)
                 uids.append((source_uid, dest_uid))
         if not uids:
             copy_uid: Optional[CopyUid] = None
@@ -297,11 +312,12 @@ class BaseSession(SessionInterface, Generic[MessageT]):
             raise MailboxReadOnly()
         mbx = await self._get_selected(selected)
         permanent_flags = selected.permanent_flags & flag_set
+        found = list(selected.messages.get_all(sequence_set))
+        msgs = await mbx.update_all([cached_msg for _, cached_msg in found],
+                                    permanent_flags, mode)
         messages: list[tuple[int, MessageT]] = []
-        for seq, cached_msg in selected.messages.get_all(sequence_set):
-            uid = cached_msg.uid
-            msg = await mbx.update(uid, cached_msg, permanent_flags, mode)
+        for (seq, _), msg in zip(found, msgs):
             if not msg.expunged:
-                selected.session_flags.update(uid, flag_set, mode)
+                selected.session_flags.update(msg.uid, flag_set, mode)
             messages.append((seq, msg))
         return messages, await mbx.update_selected(selected)
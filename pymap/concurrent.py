@@ -128,7 +128,7 @@ class _ThreadingSubsystem(Subsystem):  # pragma: no cover
         return 'threading'
 
     async def execute(self, future: Awaitable[RetT]) -> RetT:
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         ctx = copy_context()
         return await loop.run_in_executor(
             self._executor, self._run_in_thread, future, ctx)
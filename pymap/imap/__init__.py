@@ -275,7 +275,7 @@ class IMAPConnection:
             self._print('%s <--| %s', bytes(resp))
 
     async def start_tls(self) -> None:
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         transport = self.writer.transport
         protocol = transport.get_protocol()
         ssl_context = self.config.ssl_context
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from collections.abc import Awaitable, Callable, Iterable
-from typing import Optional, Union, NoReturn
+from typing import ClassVar, Optional, Union, NoReturn
 
 from pymap.bytes import MaybeBytes
 from pymap.concurrent import Event
@@ -54,6 +54,8 @@ class ConnectionState:
 
     """
 
+    _func_names: ClassVar[dict[type[Command], str]] = {}
+
     def __init__(self, login: LoginInterface, config: IMAPConfig) -> None:
         super().__init__()
         self.config = config
@@ -202,20 +204,21 @@ class ConnectionState:
             cmd.mailbox, selected=self._selected)
         data: dict[StatusAttribute, MaybeBytes] = {}
         for attr in cmd.status_list:
-            if attr == b'MESSAGES':
+            status = attr.value
+            if status == b'MESSAGES':
                 data[attr] = Number(mailbox.exists)
-            elif attr == b'RECENT':
+            elif status == b'RECENT':
                 if updates and updates.mailbox_id == mailbox.mailbox_id:
                     data[attr] = Number(updates.session_flags.recent)
                 else:
                     data[attr] = Number(mailbox.recent)
-            elif attr == b'UNSEEN':
+            elif status == b'UNSEEN':
                 data[attr] = Number(mailbox.unseen)
-            elif attr == b'UIDNEXT':
+            elif status == b'UIDNEXT':
                 data[attr] = Number(mailbox.next_uid)
-            elif attr == b'UIDVALIDITY':
+            elif status == b'UIDVALIDITY':
                 data[attr] = Number(mailbox.uid_validity)
-            elif attr == b'MAILBOXID':
+            elif status == b'MAILBOXID':
                 data[attr] = mailbox.mailbox_id.parens
         resp = ResponseOk(cmd.tag, cmd.command + b' completed.')
         resp.add_untagged(StatusResponse(cmd.mailbox, data))
@@ -249,8 +252,8 @@ class ConnectionState:
             selected=self._selected)
         resp = ResponseOk(cmd.tag, cmd.command + b' completed.')
         resp_type = LSubResponse if cmd.only_subscribed else ListResponse
-        for name, sep, attrs in mailboxes:
-            resp.add_untagged(resp_type(name, sep, attrs))
+        resp.add_untagged(*(resp_type(name, sep, attrs)
+                            for name, sep, attrs in mailboxes))
         return resp, updates
 
     async def do_check(self, cmd: CheckCommand) -> _CommandRet:
@@ -325,17 +328,20 @@ class ConnectionState:
             self.selected, cmd.sequence_set, cmd.flag_set, cmd.mode)
         resp = ResponseOk(cmd.tag, cmd.command + b' completed.')
         session_flags = self.selected.session_flags
+        silent = cmd.silent
+        with_uid = cmd.uid
         for msg_seq, msg in messages:
             if msg.expunged:
                 resp.code = ResponseCode.of(b'EXPUNGEISSUED')
-            elif cmd.silent:
+            elif silent:
                 continue
-            flags = msg.get_flags(session_flags)
-            fetch_data: list[FetchValue] = [
-                FetchValue.of(_flags_attr, List(flags, sort=True))]
-            if cmd.uid:
-                fetch_data.append(
-                    FetchValue.of(_uid_attr, Number(msg.uid)))
+            flags = List(msg.get_flags(session_flags), sort=True)
+            if with_uid:
+                fetch_data: list[FetchValue] = [
+                    FetchValue.of(_flags_attr, flags),
+                    FetchValue.of(_uid_attr, Number(msg.uid))]
+            else:
+                fetch_data = [FetchValue.of(_flags_attr, flags)]
             resp.add_untagged(FetchResponse(msg_seq, fetch_data))
         return resp, updates
 
@@ -357,11 +363,14 @@ class ConnectionState:
 
     @classmethod
     def _get_func_name(cls, cmd: Command) -> str:
-        cmd_type = type(cmd)
-        while cmd_type.delegate:
-            cmd_type = cmd_type.delegate
-        cmd_str = str(cmd_type.command, 'ascii').lower()
-        return 'do_' + cmd_str
+        orig_type = cmd_type = type(cmd)
+        func_name = cls._func_names.get(orig_type)
+        if func_name is None:
+            while cmd_type.delegate:
+                cmd_type = cmd_type.delegate
+            cmd_str = str(cmd_type.command, 'ascii').lower()
+            cls._func_names[orig_type] = func_name = 'do_' + cmd_str
+        return func_name
 
     async def do_command(self, cmd: Command) -> CommandResponse:
         if isinstance(cmd, InvalidCommand):
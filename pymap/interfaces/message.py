@@ -152,6 +152,17 @@ class MessageInterface(Protocol):
         """
         ...
 
+    def has_flag(self, flag: Flag, session_flags: SessionFlags) -> bool:
+        """Check if the message has the given flag in its permanent or session
+        flags, without necessarily building the full set of flags.
+
+        Args:
+            flag: The flag to check for.
+            session_flags: The current session flags.
+
+        """
+        return flag in self.get_flags(session_flags)
+
     @abstractmethod
     async def load_content(self, requirement: FetchRequirement) \
             -> LoadedMessageInterface:
@@ -213,7 +213,11 @@ class ListTree:
             filter_: Mailbox name with possible wildcards.
 
         """
-        canonical, canonical_i = self._get_pattern(ref_name + filter_)
+        query = ref_name + filter_
+        if query == '*':
+            yield from self.list()
+            return
+        canonical, canonical_i = self._get_pattern(query)
         for entry in self.list():
             if entry.name == 'INBOX':
                 if canonical_i.match('INBOX'):
@@ -84,6 +84,10 @@ class BaseMessage(MessageInterface, CachedMessage, metaclass=ABCMeta):
         else:
             return self._permanent_flags
 
+    def has_flag(self, flag: Flag, session_flags: SessionFlags) -> bool:
+        return flag in self._permanent_flags \
+            or flag in session_flags.get(self.uid)
+
     @property
     def flags_key(self) -> FlagsKey:
         return self._flags_key
@@ -1,6 +1,8 @@
 
 from __future__ import annotations
 
+from typing import ClassVar
+
 from .. import Params, Parseable, Space
 from ..exceptions import NotParseable, InvalidContent
 from ..primitives import Atom
@@ -20,6 +22,8 @@ class StatusAttribute(Parseable[bytes]):
     valid_statuses = {b'MESSAGES', b'RECENT', b'UIDNEXT', b'UIDVALIDITY',
                       b'UNSEEN', b'MAILBOXID'}
 
+    _cache: ClassVar[dict[bytes, StatusAttribute]] = {}
+
     def __init__(self, status: bytes) -> None:
         super().__init__()
         status = status.upper()
@@ -40,10 +44,15 @@ class StatusAttribute(Parseable[bytes]):
         except NotParseable:
             pass
         atom, after = Atom.parse(buf, params)
+        status = atom.value.upper()
+        cached = cls._cache.get(status)
+        if cached is not None:
+            return cached, after
         try:
-            return cls(atom.value), after
+            cls._cache[status] = ret = cls(status)
         except ValueError:
             raise InvalidContent(buf)
+        return ret, after
 
     def __hash__(self) -> int:
         return hash(self.value)
@@ -302,7 +302,7 @@ class HasFlagSearchCriteria(SearchCriteria):
 
     def matches(self, msg_seq: int, msg: MessageInterface,
                 loaded_msg: LoadedMessageInterface) -> bool:
-        has_flag = self.flag in msg.get_flags(self.params.session_flags)
+        has_flag = msg.has_flag(self.flag, self.params.session_flags)
         expected = self.expected
         return (has_flag and expected) or (not expected and not has_flag)
 
@@ -312,8 +312,9 @@ class NewSearchCriteria(SearchCriteria):
 
     def matches(self, msg_seq: int, msg: MessageInterface,
                 loaded_msg: LoadedMessageInterface) -> bool:
-        flags = msg.get_flags(self.params.session_flags)
-        return Recent in flags and Seen not in flags
+        session_flags = self.params.session_flags
+        return msg.has_flag(Recent, session_flags) \
+            and not msg.has_flag(Seen, session_flags)
 
 
 class DateSearchCriteria(SearchCriteria):
@@ -1,9 +1,10 @@
 
 from __future__ import annotations
 
-from bisect import bisect_right
+from array import array
+from bisect import bisect_left, insort
 from collections.abc import Iterable, MutableSet, Sequence, Set
-from itertools import chain, groupby, islice
+from itertools import chain, groupby
 from typing import Any, Optional
 from weakref import WeakSet
 
@@ -72,7 +73,7 @@ class _Frozen:
         session_flags = selected.session_flags
         self.is_deleted = selected._is_deleted
         self.uids = messages._uids.copy()
-        self.seqs_cache = messages._seqs_cache.copy()
+        self.sorted = messages._sorted[:]
         self.flags = messages._flags_key_set.copy()
         self.recent = session_flags.recent_uids & self.uids
         self.sflags = frozenset(session_flags.flags.items())
@@ -84,8 +85,7 @@ class SynchronizedMessages:
     def __init__(self) -> None:
         super().__init__()
         self._uids: set[int] = set()
-        self._sorted: list[int] = []
-        self._seqs_cache: dict[int, int] = {}
+        self._sorted = array('I')
         self._cache: dict[int, CachedMessage] = {}
         self._flags_key_map: dict[int, FlagsKey] = {}
         self._flags_key_set: set[FlagsKey] = set()
@@ -105,15 +105,11 @@ class SynchronizedMessages:
             return 0
 
     def _update(self, messages: Iterable[CachedMessage]) -> None:
-        lowest_idx: Optional[int] = None
         for msg in messages:
             msg_uid = msg.uid
             if msg_uid not in self._uids:
                 self._uids.add(msg_uid)
-                idx = bisect_right(self._sorted, msg_uid)
-                if lowest_idx is None or lowest_idx > idx:
-                    lowest_idx = idx
-                self._sorted.insert(idx, msg_uid)
+                insort(self._sorted, msg_uid)
             self._cache[msg_uid] = msg
             new_flags_key = msg.flags_key
             old_flags_key = self._flags_key_map.get(msg_uid)
@@ -121,10 +117,6 @@ class SynchronizedMessages:
                 self._flags_key_set.discard(old_flags_key)
             self._flags_key_map[msg_uid] = new_flags_key
             self._flags_key_set.add(new_flags_key)
-        if lowest_idx is not None:
-            needs_reset = islice(self._sorted, lowest_idx, len(self._sorted))
-            for seq, uid in enumerate(needs_reset, lowest_idx + 1):
-                self._seqs_cache[uid] = seq
 
     def _remove(self, uids: Iterable[int], pending: bool) -> None:
         if pending:
@@ -144,9 +136,9 @@ class SynchronizedMessages:
                     any_removed = True
             self._pending_remove.clear()
             if any_removed:
-                self._sorted = sorted_uids = sorted(self._uids)
-                self._seqs_cache = {uid: seq for seq, uid in
-                                    enumerate(sorted_uids, 1)}
+                remaining = self._uids
+                self._sorted = array('I', [uid for uid in self._sorted
+                                           if uid in remaining])
 
     def get(self, uid: int) -> Optional[CachedMessage]:
         """Return the given cached message.
@@ -157,6 +149,24 @@ class SynchronizedMessages:
         """
         return self._cache.get(uid)
 
+    def _find_uids(self, seq_set: SequenceSet) -> list[tuple[int, int]]:
+        sorted_uids = self._sorted
+        if seq_set.is_all:
+            return list(enumerate(sorted_uids, 1))
+        elif seq_set.uid:
+            all_uids = seq_set.flatten(self.max_uid) & self._uids
+            ret: list[tuple[int, int]] = []
+            idx = 0
+            for uid in sorted(all_uids):
+                idx = bisect_left(sorted_uids, uid, idx)
+                ret.append((idx + 1, uid))
+            return ret
+        else:
+            all_seqs = seq_set.flatten(self.exists)
+            num_uids = len(sorted_uids)
+            return [(seq, sorted_uids[seq - 1]) for seq in sorted(all_seqs)
+                    if 0 < seq <= num_uids]
+
     def get_uids(self, seq_set: SequenceSet) -> Sequence[tuple[int, int]]:
         """Return the message sequence numbers and their UIDs for the given
         sequence set.
@@ -165,14 +175,7 @@ class SynchronizedMessages:
             seq_set: The message sequence set.
 
         """
-        if seq_set.uid:
-            all_uids = seq_set.flatten(self.max_uid) & self._uids
-            return [(seq, uid) for seq, uid in enumerate(self._sorted, 1)
-                    if uid in all_uids]
-        else:
-            all_seqs = seq_set.flatten(self.exists)
-            return [(seq, uid) for seq, uid in enumerate(self._sorted, 1)
-                    if seq in all_seqs]
+        return self._find_uids(seq_set)
 
     def get_all(self, seq_set: SequenceSet) \
             -> Sequence[tuple[int, CachedMessage]]:
@@ -183,16 +186,8 @@ class SynchronizedMessages:
             seq_set: The message sequence set.
 
         """
-        if seq_set.uid:
-            all_uids = seq_set.flatten(self.max_uid) & self._uids
-            return [(seq, self._cache[uid])
-                    for seq, uid in enumerate(self._sorted, 1)
-                    if uid in all_uids]
-        else:
-            all_seqs = seq_set.flatten(self.exists)
-            return [(seq, self._cache[uid])
-                    for seq, uid in enumerate(self._sorted, 1)
-                    if seq in all_seqs]
+        cache = self._cache
+        return [(seq, cache[uid]) for seq, uid in self._find_uids(seq_set)]
 
 
 class SelectedMailbox:
@@ -421,7 +416,7 @@ class SelectedMailbox:
         new_uids = after.uids - before.uids
         if not self._hide_expunged and expunged_uids:
             for uid in sorted(expunged_uids, reverse=True):
-                yield ExpungeResponse(before.seqs_cache[uid])
+                yield ExpungeResponse(bisect_left(before.sorted, uid) + 1)
         if new_uids:
             yield ExistsResponse(len(after.uids))
         if len(after.recent) != len(before.recent):
@@ -433,7 +428,7 @@ class SelectedMailbox:
                            (uid for uid, _ in new_flags),
                            (uid for uid, _ in new_sflags))
         for uid, _ in groupby(sorted(fetch_uids)):
-            seq = after.seqs_cache[uid]
+            seq = bisect_left(after.sorted, uid) + 1
             msg_flags = cache[uid].get_flags(session_flags)
             fetch_data: list[FetchValue] = [
                 FetchValue.of(_flags_attr, List(msg_flags, sort=True))]
@@ -278,7 +278,7 @@ class ManageSieveConnection:
             return Response(Condition.NO, text='Bad command.')
         resp = Response(Condition.OK)
         await self._write_response(resp)
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         transport = self.writer.transport
         protocol = transport.get_protocol()
         new_transport = await loop.start_tls(
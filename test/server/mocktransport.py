@@ -41,8 +41,9 @@ class MockTransport:
     @classmethod
     def _caller(cls, frame):
         frame = frame.f_back if frame else None
-        fields = inspect.getframeinfo(frame) if frame else ('?', '?')
-        return '{0}:{1!s}'.format(fields[0], fields[1])
+        if frame is None:
+            return '?:?'
+        return '{0}:{1!s}'.format(frame.f_code.co_filename, frame.f_lineno)
 
     @classmethod
     def _fail(cls, msg):
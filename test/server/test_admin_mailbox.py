@@ -1,4 +1,7 @@
 
+import asyncio
+from typing import Final
+
 import pytest
 from grpclib.testing import ChannelFor
 from pymapadmin.grpc.admin_grpc import MailboxStub
@@ -10,6 +13,40 @@ from .base import TestBase
 
 pytestmark = pytest.mark.asyncio
 
+_DEFAULT_FLAGS: Final = ('\\Flagged', '\\Seen')
+
+_APPEND_TEMPLATE: Final = AppendRequest(
+    user='testuser', mailbox='INBOX', flags=_DEFAULT_FLAGS,
+    when=1234567890).SerializeToString()
+
+_DATA_FROM_USER: Final = b'From: user@example.com\n\ntest message!\n'
+_DATA_REJECT: Final = b'Subject: reject this\n\ntest message!\n'
+_DATA_DISCARD: Final = b'Subject: discard this\n\ntest message!\n'
+_DATA_FROM_FOO: Final = b'From: foo@example.com\n\ntest message!\n'
+_DATA_FROM_FOO_DOMAIN: Final = b'From: user@foo.com\n\ntest message!\n'
+_DATA_TO_BIGFOOT: Final = b'To: bigfoot@example.com\n\ntest message!\n'
+_DATA_EXISTS: Final = b'X-Foo: foo\nX-Bar: bar\n\ntest message!\n'
+_DATA_HEADER: Final = b'X-Caffeine: C8H10N4O2\n\ntest message!\n'
+_DATA_SIZE: Final = _DATA_FROM_USER + b'x' * (1234 - len(_DATA_FROM_USER))
+
+_FETCH_EXPECT: Final = b'* 5 FETCH (FLAGS (\\Flagged \\Recent \\Seen)' \
+    b' INTERNALDATE "13-Feb-2009 23:31:30 +0000"' \
+    b' RFC822.SIZE 38' \
+    b' ENVELOPE (NIL NIL (("" NIL "user" "example.com"))' \
+    b' (("" NIL "user" "example.com")) (("" NIL "user" "example.com"))' \
+    b' NIL NIL NIL NIL NIL)' \
+    b' BODY ("text" "plain" NIL NIL NIL "7BIT" 38 3)' \
+    b' UID 105)\r\n' \
+    b'fetch1 OK UID FETCH completed.\r\n'
+
+
+def _append_request(data: bytes = b'', **kwargs) -> AppendRequest:
+    request = AppendRequest.FromString(_APPEND_TEMPLATE)
+    request.data = data
+    for name, value in kwargs.items():
+        setattr(request, name, value)
+    return request
+
 
 class TestMailboxHandlers(TestBase):
 
@@ -22,179 +59,76 @@ class TestMailboxHandlers(TestBase):
     def overrides(self):
         return {'admin_key': b'testadmintoken'}
 
-    async def test_append(self, backend, imap_server) -> None:
-        handlers = MailboxHandlers(backend)
-        data = b'From: user@example.com\n\ntest message!\n'
-        request = AppendRequest(user='testuser', mailbox='INBOX',
-                                flags=['\\Flagged', '\\Seen'],
-                                when=1234567890, data=data)
+    @pytest.fixture
+    def handlers(self, backend):
+        return MailboxHandlers(backend)
+
+    @pytest.fixture
+    async def stub(self, handlers):
         async with ChannelFor([handlers]) as channel:
-            stub = MailboxStub(channel)
-            response = await stub.Append(request, metadata=self.metadata)
-        assert SUCCESS == response.result.code
-        assert 105 == response.uid
+            yield MailboxStub(channel)
+
+    async def test_append(self, stub, imap_server) -> None:
+        request = _append_request(_DATA_FROM_USER)
+        response = await stub.Append(request, metadata=self.metadata)
+        assert (SUCCESS, 105) == (response.result.code, response.uid)
 
         transport = self.new_transport(imap_server)
         transport.push_login()
         transport.push_select(b'INBOX')
         transport.push_readline(
             b'fetch1 UID FETCH * FULL\r\n')
-        transport.push_write(
-            b'* 5 FETCH (FLAGS (\\Flagged \\Recent \\Seen)'
-            b' INTERNALDATE "13-Feb-2009 23:31:30 +0000"'
-            b' RFC822.SIZE 38'
-            b' ENVELOPE (NIL NIL (("" NIL "user" "example.com"))'
-            b' (("" NIL "user" "example.com")) (("" NIL "user" "example.com"))'
-            b' NIL NIL NIL NIL NIL)'
-            b' BODY ("text" "plain" NIL NIL NIL "7BIT" 38 3)'
-            b' UID 105)\r\n'
-            b'fetch1 OK UID FETCH completed.\r\n')
+        transport.push_write(_FETCH_EXPECT)
         transport.push_logout()
         await self.run(transport)
 
-    async def test_append_user_not_found(self, backend) -> None:
-        handlers = MailboxHandlers(backend)
-        request = AppendRequest(user='baduser')
-        async with ChannelFor([handlers]) as channel:
-            stub = MailboxStub(channel)
-            response = await stub.Append(request, metadata=self.metadata)
-        assert FAILURE == response.result.code
-        assert 'UserNotFound' == response.result.key
-
-    async def test_append_mailbox_not_found(self, backend) -> None:
-        handlers = MailboxHandlers(backend)
-        request = AppendRequest(user='testuser', mailbox='BAD')
-        async with ChannelFor([handlers]) as channel:
-            stub = MailboxStub(channel)
-            response = await stub.Append(request, metadata=self.metadata)
-        assert FAILURE == response.result.code
-        assert 'BAD' == response.mailbox
-        assert 'MailboxNotFound' == response.result.key
-
-    async def test_append_filter_reject(self, backend) -> None:
-        handlers = MailboxHandlers(backend)
-        data = b'Subject: reject this\n\ntest message!\n'
-        request = AppendRequest(user='testuser', mailbox='INBOX',
-                                flags=['\\Flagged', '\\Seen'],
-                                when=1234567890, data=data)
-        async with ChannelFor([handlers]) as channel:
-            stub = MailboxStub(channel)
-            response = await stub.Append(request, metadata=self.metadata)
-        assert FAILURE == response.result.code
-        assert 'AppendFailure' == response.result.key
-
-    async def test_append_filter_discard(self, backend) -> None:
-        handlers = MailboxHandlers(backend)
-        data = b'Subject: discard this\n\ntest message!\n'
-        request = AppendRequest(user='testuser', mailbox='INBOX',
-                                flags=['\\Flagged', '\\Seen'],
-                                when=1234567890, data=data)
-        async with ChannelFor([handlers]) as channel:
-            stub = MailboxStub(channel)
-            response = await stub.Append(request, metadata=self.metadata)
-        assert SUCCESS == response.result.code
-        assert not response.mailbox
-        assert not response.uid
-
-    async def test_append_filter_address_is(self, backend) -> None:
-        handlers = MailboxHandlers(backend)
-        data = b'From: foo@example.com\n\ntest message!\n'
-        request = AppendRequest(user='testuser', mailbox='INBOX',
-                                flags=['\\Flagged', '\\Seen'],
-                                when=1234567890, data=data)
-        async with ChannelFor([handlers]) as channel:
-            stub = MailboxStub(channel)
-            response = await stub.Append(request, metadata=self.metadata)
-        assert 'Test 1' == response.mailbox
-
-    async def test_append_filter_address_contains(self, backend) -> None:
-        handlers = MailboxHandlers(backend)
-        data = b'From: user@foo.com\n\ntest message!\n'
-        request = AppendRequest(user='testuser', mailbox='INBOX',
-                                flags=['\\Flagged', '\\Seen'],
-                                when=1234567890, data=data)
-        async with ChannelFor([handlers]) as channel:
-            stub = MailboxStub(channel)
-            response = await stub.Append(request, metadata=self.metadata)
-        assert 'Test 2' == response.mailbox
-
-    async def test_append_filter_address_matches(self, backend) -> None:
-        handlers = MailboxHandlers(backend)
-        data = b'To: bigfoot@example.com\n\ntest message!\n'
-        request = AppendRequest(user='testuser', mailbox='INBOX',
-                                flags=['\\Flagged', '\\Seen'],
-                                when=1234567890, data=data)
-        async with ChannelFor([handlers]) as channel:
-            stub = MailboxStub(channel)
-            response = await stub.Append(request, metadata=self.metadata)
-        assert 'Test 3' == response.mailbox
-
-    async def test_append_filter_envelope_is(self, backend) -> None:
-        handlers = MailboxHandlers(backend)
-        data = b'From: user@example.com\n\ntest message!\n'
-        request = AppendRequest(user='testuser', mailbox='INBOX',
-                                sender='foo@example.com', recipient=None,
-                                flags=['\\Flagged', '\\Seen'],
-                                when=1234567890, data=data)
-        async with ChannelFor([handlers]) as channel:
-            stub = MailboxStub(channel)
-            response = await stub.Append(request, metadata=self.metadata)
-        assert 'Test 4' == response.mailbox
-
-    async def test_append_filter_envelope_contains(self, backend) -> None:
-        handlers = MailboxHandlers(backend)
-        data = b'From: user@example.com\n\ntest message!\n'
-        request = AppendRequest(user='testuser', mailbox='INBOX',
-                                sender='user@foo.com', recipient=None,
-                                flags=['\\Flagged', '\\Seen'],
-                                when=1234567890, data=data)
-        async with ChannelFor([handlers]) as channel:
-            stub = MailboxStub(channel)
-            response = await stub.Append(request, metadata=self.metadata)
-        assert 'Test 5' == response.mailbox
-
-    async def test_append_filter_envelope_matches(self, backend) -> None:
-        handlers = MailboxHandlers(backend)
-        data = b'From: user@example.com\n\ntest message!\n'
-        request = AppendRequest(user='testuser', mailbox='INBOX',
-                                sender=None, recipient='bigfoot@example.com',
-                                flags=['\\Flagged', '\\Seen'],
-                                when=1234567890, data=data)
-        async with ChannelFor([handlers]) as channel:
-            stub = MailboxStub(channel)
-            response = await stub.Append(request, metadata=self.metadata)
-        assert 'Test 6' == response.mailbox
-
-    async def test_append_filter_exists(self, backend) -> None:
-        handlers = MailboxHandlers(backend)
-        data = b'X-Foo: foo\nX-Bar: bar\n\ntest message!\n'
-        request = AppendRequest(user='testuser', mailbox='INBOX',
-                                flags=['\\Flagged', '\\Seen'],
-                                when=1234567890, data=data)
-        async with ChannelFor([handlers]) as channel:
-            stub = MailboxStub(channel)
-            response = await stub.Append(request, metadata=self.metadata)
-        assert 'Test 7' == response.mailbox
-
-    async def test_append_filter_header(self, backend) -> None:
-        handlers = MailboxHandlers(backend)
-        data = b'X-Caffeine: C8H10N4O2\n\ntest message!\n'
-        request = AppendRequest(user='testuser', mailbox='INBOX',
-                                flags=['\\Flagged', '\\Seen'],
-                                when=1234567890, data=data)
-        async with ChannelFor([handlers]) as channel:
-            stub = MailboxStub(channel)
-            response = await stub.Append(request, metadata=self.metadata)
-        assert 'Test 8' == response.mailbox
-
-    async def test_append_filter_size(self, backend) -> None:
-        handlers = MailboxHandlers(backend)
-        data = b'From: user@example.com\n\ntest message!\n'
-        data = data + b'x' * (1234 - len(data))
-        request = AppendRequest(user='testuser', mailbox='INBOX',
-                                flags=['\\Flagged', '\\Seen'],
-                                when=1234567890, data=data)
-        async with ChannelFor([handlers]) as channel:
-            stub = MailboxStub(channel)
-            response = await stub.Append(request, metadata=self.metadata)
-        assert 'Test 9' == response.mailbox
+    async def test_append_concurrent(self, handlers) -> None:
+        requests = [_append_request(_DATA_FROM_USER) for _ in range(3)]
+        responses = await asyncio.gather(
+            *(handlers._append(request, self.metadata)
+              for request in requests))
+        assert [SUCCESS] * 3 == [resp.result.code for resp in responses]
+        assert [105, 106, 107] == sorted(resp.uid for resp in responses)
+
+    async def test_append_user_not_found(self, handlers) -> None:
+        request = _append_request(user='baduser')
+        response = await handlers._append(request, self.metadata)
+        assert (FAILURE, 'UserNotFound') == \
+            (response.result.code, response.result.key)
+
+    async def test_append_mailbox_not_found(self, handlers) -> None:
+        request = _append_request(mailbox='BAD')
+        response = await handlers._append(request, self.metadata)
+        assert (FAILURE, 'MailboxNotFound', 'BAD') == \
+            (response.result.code, response.result.key, response.mailbox)
+
+    async def test_append_filter_reject(self, handlers) -> None:
+        request = _append_request(_DATA_REJECT)
+        response = await handlers._append(request, self.metadata)
+        assert (FAILURE, 'AppendFailure') == \
+            (response.result.code, response.result.key)
+
+    async def test_append_filter_discard(self, handlers) -> None:
+        request = _append_request(_DATA_DISCARD)
+        response = await handlers._append(request, self.metadata)
+        assert (SUCCESS, '', 0) == \
+            (response.result.code, response.mailbox, response.uid)
+
+    @pytest.mark.parametrize('data, sender, recipient, expected', [
+        (_DATA_FROM_FOO, '', '', 'Test 1'),
+        (_DATA_FROM_FOO_DOMAIN, '', '', 'Test 2'),
+        (_DATA_TO_BIGFOOT, '', '', 'Test 3'),
+        (_DATA_FROM_USER, 'foo@example.com', '', 'Test 4'),
+        (_DATA_FROM_USER, 'user@foo.com', '', 'Test 5'),
+        (_DATA_FROM_USER, '', 'bigfoot@example.com', 'Test 6'),
+        (_DATA_EXISTS, '', '', 'Test 7'),
+        (_DATA_HEADER, '', '', 'Test 8'),
+        (_DATA_SIZE, '', '', 'Test 9')],
+        ids=['address_is', 'address_contains', 'address_matches',
+             'envelope_is', 'envelope_contains', 'envelope_matches',
+             'exists', 'header', 'size'])
+    async def test_append_filter(self, handlers, data, sender, recipient,
+                                 expected) -> None:
+        request = _append_request(data, sender=sender, recipient=recipient)
+        response = await handlers._append(request, self.metadata)
+        assert expected == response.mailbox
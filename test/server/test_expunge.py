@@ -99,3 +99,33 @@ class TestExpunge(TestBase):
         transport.push_logout()
 
         await self.run(transport, concurrent)
+
+    async def test_concurrent_expunge_silent_store(self, imap_server):
+        transport = self.new_transport(imap_server)
+        concurrent = self.new_transport(imap_server)
+        event1, event2 = self.new_events(2)
+
+        concurrent.push_login()
+        concurrent.push_select(b'INBOX', 4, 1, set=event1)
+        concurrent.push_readline(
+            b'store2 STORE 1:* +FLAGS.SILENT (\\Flagged)\r\n', wait=event2)
+        concurrent.push_write(
+            b'* 4 FETCH (FLAGS (\\Deleted \\Flagged \\Recent))\r\n'
+            b'store2 OK [EXPUNGEISSUED] STORE completed.\r\n')
+        concurrent.push_logout()
+
+        transport.push_login()
+        transport.push_select(b'INBOX', 4, 0, wait=event1)
+        transport.push_readline(
+            b'store1 STORE * +FLAGS (\\Deleted)\r\n')
+        transport.push_write(
+            b'* 4 FETCH (FLAGS (\\Deleted))\r\n'
+            b'store1 OK STORE completed.\r\n')
+        transport.push_readline(
+            b'expunge1 EXPUNGE\r\n', set=event2)
+        transport.push_write(
+            b'* 4 EXPUNGE\r\n'
+            b'expunge1 OK EXPUNGE completed.\r\n')
+        transport.push_logout()
+
+        await self.run(transport, concurrent)
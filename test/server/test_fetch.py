@@ -294,3 +294,19 @@ class TestFetch(TestBase):
         assert len({self.matches[f'id{n}'] for n in range(1, 5)}) == 4
         for n in range(1, 5):
             assert self.matches[f'id{n}'] == self.matches[f'id{n+4}']
+
+    async def test_fetch_empty_mailbox(self, imap_server):
+        transport = self.new_transport(imap_server)
+        transport.push_login()
+        transport.push_readline(
+            b'create1 CREATE Empty\r\n')
+        transport.push_write(
+            b'create1 OK [MAILBOXID (', (br'F[a-f0-9]+', ), b')]'
+            b' CREATE completed.\r\n')
+        transport.push_select(b'Empty', 0, 0, unseen=False)
+        transport.push_readline(
+            b'fetch1 FETCH * (FLAGS)\r\n')
+        transport.push_write(
+            b'fetch1 OK FETCH completed.\r\n')
+        transport.push_logout()
+        await self.run(transport)
@@ -153,6 +153,73 @@ class TestMailbox(TestBase):
         transport.push_logout()
         await self.run(transport)
 
+    async def test_list_create_delete(self, imap_server):
+        transport = self.new_transport(imap_server)
+        transport.push_login()
+        transport.push_readline(
+            b'list1 LIST "" *\r\n')
+        transport.push_write(
+            b'* LIST (\\HasNoChildren) "/" INBOX\r\n'
+            b'* LIST (\\HasNoChildren) "/" Sent\r\n'
+            b'* LIST (\\HasNoChildren) "/" Trash\r\n'
+            b'list1 OK LIST completed.\r\n')
+        transport.push_readline(
+            b'create1 CREATE "test mailbox"\r\n')
+        transport.push_write(
+            b'create1 OK [MAILBOXID (', (br'F[a-f0-9]+', ), b')]'
+            b' CREATE completed.\r\n')
+        transport.push_readline(
+            b'list2 LIST "" *\r\n')
+        transport.push_write(
+            b'* LIST (\\HasNoChildren) "/" INBOX\r\n'
+            b'* LIST (\\HasNoChildren) "/" Sent\r\n'
+            b'* LIST (\\HasNoChildren) "/" Trash\r\n'
+            b'* LIST (\\HasNoChildren) "/" "test mailbox"\r\n'
+            b'list2 OK LIST completed.\r\n')
+        transport.push_readline(
+            b'delete1 DELETE Sent\r\n')
+        transport.push_write(
+            b'delete1 OK DELETE completed.\r\n')
+        transport.push_readline(
+            b'list3 LIST "" *\r\n')
+        transport.push_write(
+            b'* LIST (\\HasNoChildren) "/" INBOX\r\n'
+            b'* LIST (\\HasNoChildren) "/" Trash\r\n'
+            b'* LIST (\\HasNoChildren) "/" "test mailbox"\r\n'
+            b'list3 OK LIST completed.\r\n')
+        transport.push_logout()
+        await self.run(transport)
+
+    async def test_lsub_subscribe_unsubscribe(self, imap_server):
+        transport = self.new_transport(imap_server)
+        transport.push_login()
+        transport.push_readline(
+            b'lsub1 LSUB "" *\r\n')
+        transport.push_write(
+            b'* LSUB (\\HasNoChildren) "/" INBOX\r\n'
+            b'lsub1 OK LSUB completed.\r\n')
+        transport.push_readline(
+            b'subscribe1 SUBSCRIBE "Sent"\r\n')
+        transport.push_write(
+            b'subscribe1 OK SUBSCRIBE completed.\r\n')
+        transport.push_readline(
+            b'lsub2 LSUB "" *\r\n')
+        transport.push_write(
+            b'* LSUB (\\HasNoChildren) "/" INBOX\r\n'
+            b'* LSUB (\\HasNoChildren) "/" Sent\r\n'
+            b'lsub2 OK LSUB completed.\r\n')
+        transport.push_readline(
+            b'unsubscribe1 UNSUBSCRIBE "Sent"\r\n')
+        transport.push_write(
+            b'unsubscribe1 OK UNSUBSCRIBE completed.\r\n')
+        transport.push_readline(
+            b'lsub3 LSUB "" *\r\n')
+        transport.push_write(
+            b'* LSUB (\\HasNoChildren) "/" INBOX\r\n'
+            b'lsub3 OK LSUB completed.\r\n')
+        transport.push_logout()
+        await self.run(transport)
+
     async def test_status(self, imap_server):
         transport = self.new_transport(imap_server)
         transport.push_login()
@@ -188,6 +255,63 @@ class TestMailbox(TestBase):
         assert self.matches['uidval1'] == self.matches['uidval2']
         assert self.matches['mbxid1'] == self.matches['mbxid']
 
+    async def test_status_counts(self, imap_server):
+        transport = self.new_transport(imap_server)
+        transport.push_login()
+        transport.push_select(b'INBOX', 4, 1, 105, 3)
+        transport.push_readline(
+            b'store1 STORE 3 +FLAGS.SILENT (\\Seen)\r\n')
+        transport.push_write(
+            b'store1 OK STORE completed.\r\n')
+        transport.push_readline(
+            b'status1 STATUS INBOX (MESSAGES RECENT UNSEEN)\r\n')
+        transport.push_write(
+            b'* STATUS INBOX (MESSAGES 4 RECENT 1 UNSEEN 1)\r\n'
+            b'status1 OK STATUS completed.\r\n')
+        transport.push_readline(
+            b'store2 STORE 1:2 -FLAGS.SILENT (\\Seen)\r\n')
+        transport.push_write(
+            b'store2 OK STORE completed.\r\n')
+        transport.push_readline(
+            b'status2 STATUS INBOX (MESSAGES RECENT UNSEEN)\r\n')
+        transport.push_write(
+            b'* STATUS INBOX (MESSAGES 4 RECENT 1 UNSEEN 3)\r\n'
+            b'status2 OK STATUS completed.\r\n')
+        transport.push_readline(
+            b'move1 MOVE 3 Sent\r\n')
+        transport.push_write(
+            b'* OK [COPYUID ', (br'\d+', ), b' 103 103] Moved.\r\n'
+            b'* 3 EXPUNGE\r\n'
+            b'move1 OK MOVE completed.\r\n')
+        transport.push_readline(
+            b'status3 STATUS INBOX (MESSAGES RECENT UNSEEN)\r\n')
+        transport.push_write(
+            b'* STATUS INBOX (MESSAGES 3 RECENT 1 UNSEEN 3)\r\n'
+            b'status3 OK STATUS completed.\r\n')
+        transport.push_readline(
+            b'status4 STATUS Sent (MESSAGES RECENT UNSEEN)\r\n')
+        transport.push_write(
+            b'* STATUS Sent (MESSAGES 3 RECENT 1 UNSEEN 1)\r\n'
+            b'status4 OK STATUS completed.\r\n')
+        transport.push_readline(
+            b'store3 STORE 3 +FLAGS.SILENT (\\Deleted)\r\n')
+        transport.push_write(
+            b'store3 OK STORE completed.\r\n')
+        transport.push_readline(
+            b'expunge1 EXPUNGE\r\n')
+        transport.push_write(
+            b'* 3 EXPUNGE\r\n'
+            b'* 0 RECENT\r\n'
+            b'expunge1 OK EXPUNGE completed.\r\n')
+        transport.push_readline(
+            b'status5 STATUS INBOX (MESSAGES RECENT UNSEEN)\r\n')
+        transport.push_write(
+            b'* STATUS INBOX (MESSAGES 2 RECENT 0 UNSEEN 2)\r\n'
+            b'status5 OK STATUS completed.\r\n')
+        transport.push_select(b'Sent', 3, 1, 104, 2)
+        transport.push_logout()
+        await self.run(transport)
+
     async def test_append(self, imap_server):
         transport = self.new_transport(imap_server)
         message = b'test message\r\n'
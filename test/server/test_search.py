@@ -1,6 +1,9 @@
 
 import pytest
 
+from pymap.backend.dict.mailbox import Message
+from pymap.parsing.specials import FetchRequirement
+
 from .base import TestBase
 
 pytestmark = pytest.mark.asyncio
@@ -284,3 +287,38 @@ class TestSearch(TestBase):
             b'search2 OK SEARCH completed.\r\n')
         transport.push_logout()
         await self.run(transport)
+
+    async def test_search_metadata_and_content(self, imap_server,
+                                               monkeypatch):
+        content_loads: list[int] = []
+        load_content = Message.load_content
+
+        async def _load_content(msg, requirement):
+            if requirement & FetchRequirement.CONTENT:
+                content_loads.append(msg.uid)
+            return await load_content(msg, requirement)
+
+        monkeypatch.setattr(Message, 'load_content', _load_content)
+        transport = self.new_transport(imap_server)
+        transport.push_login()
+        transport.push_select(b'INBOX')
+        transport.push_readline(
+            b'search1 SEARCH UNSEEN BODY important\r\n')
+        transport.push_write(
+            b'* SEARCH 3\r\n'
+            b'search1 OK SEARCH completed.\r\n')
+        transport.push_logout()
+        await self.run(transport)
+        assert [103, 104] == content_loads
+
+    async def test_search_or_metadata_content(self, imap_server):
+        transport = self.new_transport(imap_server)
+        transport.push_login()
+        transport.push_select(b'INBOX')
+        transport.push_readline(
+            b'search1 SEARCH OR SEEN SUBJECT notice\r\n')
+        transport.push_write(
+            b'* SEARCH 1 2 3\r\n'
+            b'search1 OK SEARCH completed.\r\n')
+        transport.push_logout()
+        await self.run(transport)
@@ -90,3 +90,37 @@ class TestStore(TestBase):
             b'store1 OK STORE completed.\r\n')
         transport.push_logout()
         await self.run(transport)
+
+    async def test_concurrent_store_unchanged(self, imap_server):
+        transport = self.new_transport(imap_server)
+        concurrent = self.new_transport(imap_server)
+        event1, event2, event3, event4 = self.new_events(4)
+
+        concurrent.push_login()
+        concurrent.push_select(b'INBOX', 4, 1, set=event1)
+        concurrent.push_readline(
+            b'noop1 NOOP\r\n', wait=event2)
+        concurrent.push_write(
+            b'noop1 OK NOOP completed.\r\n', set=event3)
+        concurrent.push_readline(
+            b'noop2 NOOP\r\n', wait=event4)
+        concurrent.push_write(
+            b'* 3 FETCH (FLAGS (\\Flagged \\Seen))\r\n'
+            b'noop2 OK NOOP completed.\r\n')
+        concurrent.push_logout()
+
+        transport.push_login()
+        transport.push_select(b'INBOX', 4, 0, wait=event1)
+        transport.push_readline(
+            b'store1 STORE 1 +FLAGS (\\Seen)\r\n')
+        transport.push_write(
+            b'* 1 FETCH (FLAGS (\\Seen))\r\n'
+            b'store1 OK STORE completed.\r\n', set=event2)
+        transport.push_readline(
+            b'store2 STORE 3 +FLAGS (\\Seen)\r\n', wait=event3)
+        transport.push_write(
+            b'* 3 FETCH (FLAGS (\\Flagged \\Seen))\r\n'
+            b'store2 OK STORE completed.\r\n', set=event4)
+        transport.push_logout()
+
+        await self.run(transport, concurrent)
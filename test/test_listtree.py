@@ -57,6 +57,8 @@ class TestListTree(unittest.TestCase):
                          list(self.tree.list_matching('Important/', '%')))
         self.assertEqual([ListEntry('INBOX', True, None, False)],
                          list(self.tree.list_matching('inbox', '')))
+        self.assertEqual(list(self.tree.list()),
+                         list(self.tree.list_matching('', '*')))
 
     def test_get_renames(self) -> None:
         self.assertEqual([], self.tree.get_renames('Missing', 'Test'))
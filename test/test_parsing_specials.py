@@ -186,6 +186,13 @@ class TestStatusAttribute(unittest.TestCase):
         self.assertEqual(b'MESSAGES', ret.value)
         self.assertEqual(b'  ', buf)
 
+    def test_parse_cached(self):
+        ret1, _ = StatusAttribute.parse(b'unseen', Params())
+        ret2, _ = StatusAttribute.parse(b'UNSEEN', Params())
+        self.assertIs(ret1, ret2)
+        ret3, _ = StatusAttribute.parse(b'UnSeen', Params())
+        self.assertIs(ret1, ret3)
+
     def test_parse_invalid(self):
         with self.assertRaises(InvalidContent):
             StatusAttribute.parse(b'test', Params())
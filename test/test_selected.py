@@ -7,6 +7,7 @@ from pymap.message import BaseMessage
 from pymap.parsing.command.select import SearchCommand, UidSearchCommand
 from pymap.parsing.response import ResponseOk
 from pymap.parsing.specials import SequenceSet, ObjectId
+from pymap.parsing.specials.sequenceset import MaxValue
 from pymap.parsing.specials.flag import Seen, Flagged, Flag
 from pymap.selected import SelectedMailbox
 
@@ -227,3 +228,23 @@ class TestSelectedMailbox(unittest.TestCase):
         self.response.add_untagged(*untagged)
         self.assertEqual(b'* BYE Selected mailbox no longer exists.\r\n'
                          b'. OK testing\r\n', bytes(self.response))
+
+    def test_get_uids(self) -> None:
+        selected = self.new_selected()
+        self.set_messages(selected, [],
+                          [(2, []), (4, []), (5, []), (9, [])])
+        messages = selected.messages
+        self.assertEqual([(1, 2), (2, 4), (3, 5), (4, 9)],
+                         messages.get_uids(SequenceSet.all()))
+        self.assertEqual([(2, 4), (4, 9)],
+                         messages.get_uids(SequenceSet([4, 2, 7])))
+        self.assertEqual([(2, 4), (4, 9)],
+                         messages.get_uids(SequenceSet([4, 9, 3], True)))
+        self.assertEqual([(4, 9)],
+                         messages.get_uids(SequenceSet([(5, MaxValue())])))
+
+    def test_get_uids_empty(self) -> None:
+        messages = self.new_selected().messages
+        self.assertEqual([], messages.get_uids(SequenceSet([MaxValue()])))
+        self.assertEqual([], messages.get_uids(
+            SequenceSet([(5, MaxValue())])))